@@ -25,27 +25,68 @@ Configuration:
     - Supported extensions: .txt, .md
 """
 
+import asyncio
+import functools
 import os
+import re
 import subprocess
+import sys
 import json
-import time
 from pathlib import Path
-from typing import List, Set, Dict, Any, Optional, Tuple
+from typing import List, Set, Dict, Any, Optional, Tuple, Callable
 
 # Third-party imports
 from prompt_toolkit import Application
+from prompt_toolkit.application import get_app
 from prompt_toolkit.buffer import Buffer
-from prompt_toolkit.layout.containers import HSplit, Window
+from prompt_toolkit.filters import Condition
+from prompt_toolkit.formatted_text import ANSI
+from prompt_toolkit.history import DummyHistory
+from prompt_toolkit.layout.containers import ConditionalContainer, HSplit, Window
 from prompt_toolkit.layout.controls import BufferControl, FormattedTextControl
 from prompt_toolkit.layout.layout import Layout
 from prompt_toolkit.layout.dimension import Dimension
 from prompt_toolkit.key_binding import KeyBindings
+from prompt_toolkit.keys import Keys
+from prompt_toolkit.shortcuts import PromptSession
 from prompt_toolkit.styles import Style
 
 # --- Configuration Constants ---
 CONFIG_FILE = Path(__file__).parent / "notecli_config.json"
 DEFAULT_EDITOR = "vim"
 NOTE_EXTENSIONS = [".txt", ".md"]
+SEARCH_DEBOUNCE_SECONDS = 0.05
+STATUS_MESSAGE_SECONDS = 3.0
+_NOTE_EXT_TUPLE = tuple(NOTE_EXTENSIONS)
+
+# Extensions of files that could be executed
+_DANGEROUS_EXTS = (
+    '.exe', '.sh', '.bat', '.cmd', '.py', '.js', '.php',
+    '.rb', '.pl', '.ps1', '.vbs', '.jar', '.app'
+)
+# Null bytes, path separators or parent directory references anywhere in a
+# filename, or a dangerous extension at its end, matched in a single pass
+_BAD_FILENAME_RE = re.compile(
+    r'[\x00/\\]|\.\.|(?:' + '|'.join(re.escape(ext) for ext in _DANGEROUS_EXTS) + r')\Z',
+    re.IGNORECASE
+)
+
+# Sensitive system directories that must never be used as note folders
+_SENSITIVE_DIRS = (
+    '/etc', '/var', '/usr', '/bin', '/sbin', '/root',
+    '/boot', '/dev', '/proc', '/sys', '/tmp',
+    'C:\\Windows', 'C:\\System32', 'C:\\Program Files'
+)
+
+# Serialized config as last read from or written to CONFIG_FILE
+_saved_config_json: Optional[str] = None
+
+# Prompt session shared by all line prompts, created on first use
+_prompt_session: Optional[PromptSession] = None
+
+# Single-key pause application and the message it shows, created on first use
+_key_wait_app: Optional[Application] = None
+_key_wait_message = ""
 
 # --- Color Constants ---
 class Colors:
@@ -60,9 +101,69 @@ class Colors:
     UNDERLINE = '\033[4m'
     END = '\033[0m'
 
+# --- Message Prefixes ---
+# Colored prefixes shared by status messages; close each message with _END
+_ERR = f"{Colors.RED}Error: "
+_SEC_ERR = f"{Colors.RED}Security Error: "
+_WARN = f"{Colors.YELLOW}Warning: "
+_CAUTION = f"{Colors.YELLOW}⚠ "
+_OK = f"{Colors.GREEN}✓ "
+_FAIL = f"{Colors.RED}✗ "
+_END = Colors.END
+
+# --- Tree Row Styles ---
+# Indexed as _ROW_STYLES[is_folder][is_selected]
+_ROW_STYLES = (("", "class:selected"), ("class:folder", "class:selected-folder"))
+
 # --- Type Definitions ---
-TreeItem = Tuple[str, Any, int]  # (type, item, indent_level)
-AppState = Dict[str, Any]
+TreeItem = Tuple[str, Any, int, str]  # (type, item, indent_level, row_text)
+
+
+class AppState:
+    """TUI state shared by the key bindings, the renderer and the main loop."""
+    
+    __slots__ = (
+        "selected_index", "note_to_open", "manage_folders", "create_file_in",
+        "create_folder_in", "delete_file", "show_help", "expanded_folder_ids",
+        "tree_items", "query", "scroll_top",
+    )
+    
+    def __init__(self, expanded_folder_ids: Optional[Set[int]] = None):
+        """
+        Initialize the state with nothing selected or pending.
+        
+        Args:
+            expanded_folder_ids: Ids of folders that start out expanded
+        """
+        self.selected_index = 0
+        self.note_to_open: Optional[Path] = None
+        self.manage_folders = False
+        self.create_file_in: Optional[str] = None
+        self.create_folder_in: Optional[str] = None
+        self.delete_file: Optional[Path] = None
+        self.show_help = False
+        self.expanded_folder_ids: Set[int] = expanded_folder_ids if expanded_folder_ids is not None else set()
+        self.tree_items: List[TreeItem] = []
+        self.query = ""
+        self.scroll_top = 0
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve(path: str) -> Path:
+    """
+    Expand and resolve a path, memoizing the result.
+    
+    Resolving walks every symlink in the path, so the same configured
+    folders and notes are not resolved again on each lookup. The cache is
+    cleared whenever the notes are rescanned.
+    
+    Args:
+        path: The path to expand and resolve
+        
+    Returns:
+        The absolute resolved path
+    """
+    return Path(path).expanduser().resolve()
 
 
 def is_safe_path(base_path: Path, user_path: str) -> bool:
@@ -78,7 +179,7 @@ def is_safe_path(base_path: Path, user_path: str) -> bool:
     """
     try:
         # Resolve the full path to handle any symlinks or relative paths
-        full_path = (base_path / user_path).resolve()
+        full_path = _resolve(str(base_path / user_path))
         # Check if the resolved path is within the base directory
         return base_path in full_path.parents or base_path == full_path
     except (ValueError, RuntimeError):
@@ -113,25 +214,8 @@ def validate_filename(filename: str) -> bool:
     Returns:
         True if the filename is safe, False otherwise
     """
-    # Dangerous extensions that could be executed
-    dangerous_extensions = [
-        '.exe', '.sh', '.bat', '.cmd', '.py', '.js', '.php', 
-        '.rb', '.pl', '.ps1', '.vbs', '.jar', '.app'
-    ]
-    
-    # Check for dangerous extensions
-    if any(filename.lower().endswith(ext) for ext in dangerous_extensions):
-        return False
-    
-    # Check for path traversal attempts
-    if '..' in filename or '/' in filename or '\\' in filename:
-        return False
-    
-    # Check for null bytes or other dangerous characters
-    if '\x00' in filename:
-        return False
-    
-    return True
+    # Rejects dangerous extensions, path traversal attempts and null bytes
+    return _BAD_FILENAME_RE.search(filename) is None
 
 
 def validate_folder_access(folder_path: Path) -> bool:
@@ -145,19 +229,11 @@ def validate_folder_access(folder_path: Path) -> bool:
         True if the folder is safe to access, False otherwise
     """
     try:
-        resolved_path = folder_path.resolve()
-        
-        # List of sensitive system directories to avoid
-        sensitive_dirs = [
-            '/etc', '/var', '/usr', '/bin', '/sbin', '/root',
-            '/boot', '/dev', '/proc', '/sys', '/tmp',
-            'C:\\Windows', 'C:\\System32', 'C:\\Program Files'
-        ]
+        resolved_path = _resolve(str(folder_path))
         
         # Check if the path is in a sensitive directory
-        for sensitive_dir in sensitive_dirs:
-            if str(resolved_path).startswith(sensitive_dir):
-                return False
+        if str(resolved_path).startswith(_SENSITIVE_DIRS):
+            return False
         
         # Ensure the path is a directory and accessible
         return resolved_path.is_dir() and os.access(resolved_path, os.R_OK)
@@ -168,7 +244,61 @@ def validate_folder_access(folder_path: Path) -> bool:
 
 def clear_screen() -> None:
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if os.name == 'nt':
+        os.system('cls')
+    else:
+        # Clear and move the cursor home directly instead of forking a shell
+        sys.stdout.write('\033[2J\033[H')
+        sys.stdout.flush()
+
+
+def read_input(message: str) -> str:
+    """
+    Read a line of input from the user.
+    
+    Uses a single prompt_toolkit session for every prompt rather than
+    re-initializing the terminal each time. Answers are not kept in history
+    so confirmations like 'DELETE' cannot be recalled with the arrow keys.
+    
+    Args:
+        message: Prompt to display, may contain ANSI color codes
+        
+    Returns:
+        The line entered by the user
+    """
+    global _prompt_session
+    if _prompt_session is None:
+        _prompt_session = PromptSession(history=DummyHistory())
+    return _prompt_session.prompt(ANSI(message))
+
+
+def wait_for_key(message: str = "Press any key to return..") -> None:
+    """
+    Show a message and wait for a single keypress.
+    
+    Ctrl-C raises KeyboardInterrupt instead of dismissing the message.
+    
+    Args:
+        message: Message to display, may contain ANSI color codes
+    """
+    global _key_wait_app, _key_wait_message
+    if _key_wait_app is None:
+        kb = KeyBindings()
+        
+        @kb.add("c-c")
+        def _(event):
+            event.app.exit(exception=KeyboardInterrupt())
+        
+        @kb.add(Keys.Any)
+        def _(event):
+            event.app.exit()
+        
+        _key_wait_app = Application(
+            layout=Layout(Window(FormattedTextControl(lambda: ANSI(_key_wait_message)))),
+            key_bindings=kb
+        )
+    _key_wait_message = message
+    _key_wait_app.run()
 
 
 def load_config() -> Dict[str, List[str]]:
@@ -179,12 +309,15 @@ def load_config() -> Dict[str, List[str]]:
         Dict containing configuration with 'folders' key listing search directories.
         Returns empty config if file doesn't exist or is invalid.
     """
+    global _saved_config_json
     if CONFIG_FILE.exists():
         try:
             with open(CONFIG_FILE, "r") as f:
-                return json.load(f)
+                config = json.load(f)
         except (json.JSONDecodeError, IOError):
             return {"folders": []}
+        _saved_config_json = json.dumps(config, indent=4)
+        return config
     return {"folders": []}
 
 
@@ -192,13 +325,30 @@ def save_config(config: Dict[str, List[str]]) -> None:
     """
     Save configuration to JSON file.
     
+    The file is only written when the configuration differs from what was
+    last loaded or saved, and is replaced atomically so an interrupted save
+    never leaves a truncated config behind.
+    
     Args:
         config: Configuration dictionary to save
     """
+    global _saved_config_json
+    config_json = json.dumps(config, indent=4)
+    if config_json == _saved_config_json:
+        return
+    
+    temp_file = CONFIG_FILE.with_suffix(".json.tmp")
     try:
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(config, f, indent=4)
+        with open(temp_file, "w") as f:
+            f.write(config_json)
+        os.replace(temp_file, CONFIG_FILE)
+        _saved_config_json = config_json
     except IOError as e:
+        # Don't leave a partial temp file next to the config
+        try:
+            temp_file.unlink()
+        except OSError:
+            pass
         print(f"Error saving config: {e}")
 
 
@@ -212,34 +362,101 @@ def get_editor() -> str:
     return os.environ.get("EDITOR", DEFAULT_EDITOR)
 
 
-def find_notes(folders: List[str]) -> List[Path]:
+def scan_folder(path: Path) -> Tuple[List[Path], Set[str], Dict[str, int]]:
+    """
+    Find all note files and subfolders beneath a single folder.
+    
+    Args:
+        path: Resolved folder path to walk
+        
+    Returns:
+        Tuple of (note files, subfolder paths relative to the folder,
+        modification time in nanoseconds of every directory walked)
+    """
+    notes = []
+    subfolders = set()
+    dir_mtimes = {}
+    # Walk with scandir so only matching entries become Path objects;
+    # DirEntry type checks are answered from the directory listing itself.
+    pending = [(str(path), "")]
+    while pending:
+        current, relative = pending.pop()
+        try:
+            # Taken before listing, so a change during the walk is seen next time
+            dir_mtimes[current] = os.stat(current).st_mtime_ns
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Interned so every index keyed by this folder shares one string
+                        relative_dir = sys.intern(f"{relative}/{entry.name}" if relative else entry.name)
+                        subfolders.add(relative_dir)
+                        pending.append((entry.path, relative_dir))
+                    elif entry.name.lower().endswith(_NOTE_EXT_TUPLE) and entry.is_file():
+                        notes.append(Path(entry.path))
+        except (PermissionError, OSError) as e:
+            print(f"{_WARN}Cannot access folder '{current}': {e}{_END}")
+            continue
+    return notes, subfolders, dir_mtimes
+
+
+def _dirs_unchanged(dir_mtimes: Dict[str, int]) -> bool:
+    """
+    Check whether none of the given directories were modified.
+    
+    Args:
+        dir_mtimes: Directory paths mapped to their recorded modification time
+        
+    Returns:
+        True if every directory still exists with the same modification time
+    """
+    try:
+        return all(os.stat(directory).st_mtime_ns == mtime for directory, mtime in dir_mtimes.items())
+    except OSError:
+        return False
+
+
+def scan_folders(folders: List[str], cache: Optional[Dict[str, Tuple[Dict[str, int], List[Path], Set[str]]]] = None,
+                 verify: bool = True) -> Tuple[List[Path], Set[str]]:
     """
-    Find all note files in the specified folders.
+    Find all note files and subfolders in the specified folders.
+    
+    Each folder tree is walked once, collecting notes and subfolders together
+    so empty folders can be shown without a second traversal. When a cache is
+    given, a folder whose directories all kept their modification times is
+    not walked again.
     
     Args:
         folders: List of folder paths to search
+        cache: Optional scan results by resolved folder path, updated in place
+        verify: Whether to check cached folders for modified directories;
+            when False, every cached folder is reused as is
         
     Returns:
-        List of Path objects for found note files, sorted alphabetically
+        Tuple of (note files sorted alphabetically by name, subfolder paths
+        relative to the configured folder they were found in)
     """
     notes = []
+    subfolders = set()
     for folder in folders:
-        path = Path(folder).expanduser()
+        path = _resolve(folder)
         
         # Security check: Validate folder access before scanning
         if not validate_folder_access(path):
-            print(f"{Colors.YELLOW}Warning: Skipping unsafe folder '{folder}'{Colors.END}")
+            print(f"{_WARN}Skipping unsafe folder '{folder}'{_END}")
             continue
             
         if path.is_dir():
-            try:
-                for note_file in path.rglob("*"):
-                    if note_file.is_file() and note_file.suffix.lower() in NOTE_EXTENSIONS:
-                        notes.append(note_file)
-            except (PermissionError, OSError) as e:
-                print(f"{Colors.YELLOW}Warning: Cannot access folder '{folder}': {e}{Colors.END}")
-                continue
-    return sorted(notes, key=lambda x: x.name)
+            key = str(path)
+            cached = cache.get(key) if cache is not None else None
+            if cached is not None and (not verify or _dirs_unchanged(cached[0])):
+                dir_mtimes, folder_notes, folder_subfolders = cached
+            else:
+                folder_notes, folder_subfolders, dir_mtimes = scan_folder(path)
+                if cache is not None:
+                    cache[key] = (dir_mtimes, folder_notes, folder_subfolders)
+            notes.extend(folder_notes)
+            subfolders.update(folder_subfolders)
+    return sorted(notes, key=lambda x: x.name), subfolders
 
 
 def open_note(note_path: Path) -> None:
@@ -253,14 +470,14 @@ def open_note(note_path: Path) -> None:
     
     # Validate the editor command for security
     if not validate_editor(editor):
-        print(f"{Colors.RED}Security Error: Editor '{editor}' is not in the allowed list.{Colors.END}")
+        print(f"{_SEC_ERR}Editor '{editor}' is not in the allowed list.{_END}")
         print(f"{Colors.YELLOW}Please set a safe editor in your $EDITOR environment variable.{Colors.END}")
         return
     
     try:
         subprocess.run([editor, str(note_path)], check=True)
     except FileNotFoundError:
-        print(f"{Colors.RED}Error: Editor '{editor}' not found. Please check your $EDITOR environment variable.{Colors.END}")
+        print(f"{_ERR}Editor '{editor}' not found. Please check your $EDITOR environment variable.{_END}")
     except subprocess.CalledProcessError as e:
         print(f"{Colors.RED}Error opening note with {editor}: {e}{Colors.END}")
 
@@ -279,11 +496,11 @@ def create_new_note(folder_path: str, config: Dict[str, List[str]]) -> Optional[
     # Find the absolute path of the folder
     absolute_folder_path = None
     for config_folder in config["folders"]:
-        config_path = Path(config_folder).expanduser().resolve()
+        config_path = _resolve(config_folder)
         try:
             # Validate that the folder_path doesn't escape the config folder
             if not is_safe_path(config_path, folder_path):
-                print(f"{Colors.RED}Security Error: Invalid folder path '{folder_path}'{Colors.END}")
+                print(f"{_SEC_ERR}Invalid folder path '{folder_path}'{_END}")
                 return None
             
             absolute_folder_path = config_path / folder_path
@@ -293,24 +510,24 @@ def create_new_note(folder_path: str, config: Dict[str, List[str]]) -> Optional[
             continue
     
     if not absolute_folder_path or not absolute_folder_path.is_dir():
-        print(f"{Colors.RED}Error: Could not find folder '{folder_path}'{Colors.END}")
+        print(f"{_ERR}Could not find folder '{folder_path}'{_END}")
         return None
     
     # Get filename from user
     print(f'{Colors.YELLOW}Empty name will not create a file and go back to the main menu{Colors.END}')
-    filename = input(f"Enter filename for new note in '{folder_path}': ").strip()
+    filename = read_input(f"Enter filename for new note in '{folder_path}': ").strip()
     if not filename:
         print(f"{Colors.YELLOW}No filename provided. Going back to the main menu.{Colors.END}")
         return None
     
     # Validate filename for security
     if not validate_filename(filename):
-        print(f"{Colors.RED}Security Error: Invalid filename '{filename}'{Colors.END}")
+        print(f"{_SEC_ERR}Invalid filename '{filename}'{_END}")
         print(f"{Colors.YELLOW}Filename contains dangerous characters or extensions.{Colors.END}")
         return None
     
     # Add .md extension if no extension provided
-    if not any(filename.endswith(ext) for ext in NOTE_EXTENSIONS):
+    if not filename.endswith(_NOTE_EXT_TUPLE):
         filename += ".md"
     
     # Create the full file path
@@ -318,7 +535,7 @@ def create_new_note(folder_path: str, config: Dict[str, List[str]]) -> Optional[
     
     # Check if file already exists
     if new_file_path.exists():
-        print(f"{Colors.RED}Error: File '{filename}' already exists.{Colors.END}")
+        print(f"{_ERR}File '{filename}' already exists.{_END}")
         return None
     
     # Create the file
@@ -345,11 +562,11 @@ def create_new_folder(parent_folder_path: str, config: Dict[str, List[str]]) ->
     # Find the absolute path of the parent folder
     absolute_parent_path = None
     for config_folder in config["folders"]:
-        config_path = Path(config_folder).expanduser().resolve()
+        config_path = _resolve(config_folder)
         try:
             # Validate that the parent_folder_path doesn't escape the config folder
             if not is_safe_path(config_path, parent_folder_path):
-                print(f"{Colors.RED}Security Error: Invalid parent folder path '{parent_folder_path}'{Colors.END}")
+                print(f"{_SEC_ERR}Invalid parent folder path '{parent_folder_path}'{_END}")
                 return None
             
             absolute_parent_path = config_path / parent_folder_path
@@ -359,19 +576,19 @@ def create_new_folder(parent_folder_path: str, config: Dict[str, List[str]]) ->
             continue
     
     if not absolute_parent_path or not absolute_parent_path.is_dir():
-        print(f"{Colors.RED}Error: Could not find parent folder '{parent_folder_path}'{Colors.END}")
+        print(f"{_ERR}Could not find parent folder '{parent_folder_path}'{_END}")
         return None
     
     # Get folder name from user
     print(f'{Colors.YELLOW}Empty name will not create a folder and go back to the main menu{Colors.END}')
-    folder_name = input(f"Enter name for new folder in '{parent_folder_path}': ").strip()
+    folder_name = read_input(f"Enter name for new folder in '{parent_folder_path}': ").strip()
     if not folder_name:
         print(f"{Colors.YELLOW}No folder name provided. Going back to the main menu.{Colors.END}")
         return None
     
     # Validate folder name for security
     if not validate_filename(folder_name):
-        print(f"{Colors.RED}Security Error: Invalid folder name '{folder_name}'{Colors.END}")
+        print(f"{_SEC_ERR}Invalid folder name '{folder_name}'{_END}")
         print(f"{Colors.YELLOW}Folder name contains dangerous characters.{Colors.END}")
         return None
     
@@ -380,7 +597,7 @@ def create_new_folder(parent_folder_path: str, config: Dict[str, List[str]]) ->
     
     # Check if folder already exists
     if new_folder_path.exists():
-        print(f"{Colors.RED}Error: Folder '{folder_name}' already exists.{Colors.END}")
+        print(f"{_ERR}Folder '{folder_name}' already exists.{_END}")
         return None
     
     # Create the folder
@@ -405,18 +622,14 @@ def delete_file(note_path: Path, config: Dict[str, List[str]]) -> bool:
         True if file was deleted, False if cancelled or failed
     """
     # Security check: Ensure the file is within one of the configured folders
-    file_is_safe = False
-    for config_folder in config["folders"]:
-        config_path = Path(config_folder).expanduser().resolve()
-        try:
-            if config_path in note_path.resolve().parents or config_path == note_path.resolve().parent:
-                file_is_safe = True
-                break
-        except (ValueError, RuntimeError):
-            continue
+    try:
+        note_parents = set(_resolve(str(note_path)).parents)
+    except (ValueError, RuntimeError):
+        note_parents = set()
+    file_is_safe = any(_resolve(config_folder) in note_parents for config_folder in config["folders"])
     
     if not file_is_safe:
-        print(f"{Colors.RED}Security Error: Cannot delete file outside configured folders.{Colors.END}")
+        print(f"{_SEC_ERR}Cannot delete file outside configured folders.{_END}")
         return False
     
     print(f"{Colors.YELLOW}⚠️ You are about to delete the file:{Colors.END}")
@@ -424,7 +637,7 @@ def delete_file(note_path: Path, config: Dict[str, List[str]]) -> bool:
     print(f"{Colors.YELLOW}This action cannot be undone!{Colors.END}\n")
     
     # Get confirmation from user
-    confirm = input(f"{Colors.CYAN}Type 'DELETE' to confirm deletion: {Colors.END}").strip()
+    confirm = read_input(f"{Colors.CYAN}Type 'DELETE' to confirm deletion: {Colors.END}").strip()
     
     if confirm != "DELETE":
         print(f"{Colors.YELLOW}Deletion cancelled.{Colors.END}")
@@ -433,16 +646,15 @@ def delete_file(note_path: Path, config: Dict[str, List[str]]) -> bool:
     # Delete the file
     try:
         note_path.unlink()
-        print(f"{Colors.GREEN}✓ File deleted successfully: {note_path.name}{Colors.END}")
+        print(f"{_OK}File deleted successfully: {note_path.name}{_END}")
         return True
     except Exception as e:
-        print(f"{Colors.RED}✗ Error deleting file: {e}{Colors.END}")
+        print(f"{_FAIL}Error deleting file: {e}{_END}")
         return False
 
 
-def show_info() -> None:
-    """Display comprehensive information about Note CLI."""
-    info_text = f"""
+# Help screen text, formatted once at import
+_INFO_TEXT = f"""
 {Colors.CYAN}╔══════════════════════════════════════════════════════════════╗{Colors.END}
 {Colors.CYAN}║                    {Colors.BOLD}Welcome to Note CLI{Colors.END}{Colors.CYAN}                       ║{Colors.END}
 {Colors.CYAN}╚══════════════════════════════════════════════════════════════╝{Colors.END}
@@ -483,8 +695,12 @@ def show_info() -> None:
 
 {Colors.CYAN}╔══════════════════════════════════════════════════════════════╗{Colors.END}
 """
-    print(info_text)
-    input(f"{Colors.CYAN}Press Enter to continue...{Colors.END}")
+
+
+def show_info() -> None:
+    """Display comprehensive information about Note CLI."""
+    print(_INFO_TEXT)
+    wait_for_key(f"{Colors.CYAN}Press any key to continue...{Colors.END}")
 
 
 def manage_folders_menu(config: Dict[str, List[str]]) -> None:
@@ -495,66 +711,96 @@ def manage_folders_menu(config: Dict[str, List[str]]) -> None:
         config: Application configuration to modify
     """
     while True:
-        print("\n" + "─" * 50)
-        print("                    MANAGE FOLDERS")
-        print("─" * 50)
-        print("Current search folders:")
+        # Build the whole menu and write it in one go
+        lines = [
+            "\n" + "─" * 50,
+            "                    MANAGE FOLDERS",
+            "─" * 50,
+            "Current search folders:",
+        ]
         
         if not config["folders"]:
-            print("  (None)")
+            lines.append("  (None)")
         else:
-            for i, folder in enumerate(config["folders"], 1):
-                print(f"  {i}: {folder}")
+            lines.extend(f"  {i}: {folder}" for i, folder in enumerate(config["folders"], 1))
 
-        print("\nOptions:")
-        print("  (a) Add a folder")
-        print("  (r) Remove a folder")
-        print("  (b) Back to main menu")
+        lines.extend([
+            "\nOptions:",
+            "  (a) Add a folder",
+            "  (r) Remove a folder",
+            "  (b) Back to main menu",
+        ])
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
-        choice = input("\nEnter your choice: ").lower().strip()
+        choice = read_input("\nEnter your choice: ").lower().strip()
 
         if choice == 'a':
-            folder_path = input("Enter the absolute path of the folder to add: ").strip()
+            folder_path = read_input("Enter the absolute path of the folder to add: ").strip()
             if folder_path:
                 expanded_path = Path(folder_path).expanduser()
                 
                 # Validate folder access for security
                 if not validate_folder_access(expanded_path):
-                    print(f"{Colors.RED}✗ Security Error: Folder '{folder_path}' is not safe to access.{Colors.END}")
-                    print(f"{Colors.YELLOW}Please choose a folder in your home directory or a safe location.{Colors.END}")
+                    print(f"{_FAIL}Security Error: Folder '{folder_path}' is not safe to access.{_END}\n"
+                          f"{Colors.YELLOW}Please choose a folder in your home directory or a safe location.{Colors.END}")
                 elif expanded_path.is_dir():
-                    path_str = str(expanded_path.resolve())
+                    path_str = str(_resolve(folder_path))
                     if path_str not in config["folders"]:
                         config["folders"].append(path_str)
                         save_config(config)
-                        print(f"{Colors.GREEN}✓ Folder '{path_str}' added successfully.{Colors.END}")
+                        print(f"{_OK}Folder '{path_str}' added successfully.{_END}")
                     else:
-                        print(f"{Colors.YELLOW}⚠ Folder already in the list.{Colors.END}")
+                        print(f"{_CAUTION}Folder already in the list.{_END}")
                 else:
-                    print(f"{Colors.RED}✗ Error: Invalid folder path.{Colors.END}")
+                    print(f"{_FAIL}Error: Invalid folder path.{_END}")
             else:
-                print(f"{Colors.RED}✗ No path provided.{Colors.END}")
+                print(f"{_FAIL}No path provided.{_END}")
                 
         elif choice == 'r':
             if not config["folders"]:
-                print(f"{Colors.YELLOW}⚠ No folders to remove.{Colors.END}")
+                print(f"{_CAUTION}No folders to remove.{_END}")
                 continue
                 
             try:
-                folder_num = int(input("Enter the number of the folder to remove: "))
+                folder_num = int(read_input("Enter the number of the folder to remove: "))
                 if 1 <= folder_num <= len(config["folders"]):
                     removed_folder = config["folders"].pop(folder_num - 1)
                     save_config(config)
-                    print(f"{Colors.GREEN}✓ Folder '{removed_folder}' removed successfully.{Colors.END}")
+                    print(f"{_OK}Folder '{removed_folder}' removed successfully.{_END}")
                 else:
-                    print(f"{Colors.RED}✗ Invalid folder number.{Colors.END}")
+                    print(f"{_FAIL}Invalid folder number.{_END}")
             except ValueError:
-                print(f"{Colors.RED}✗ Invalid input. Please enter a number.{Colors.END}")
+                print(f"{_FAIL}Invalid input. Please enter a number.{_END}")
                 
         elif choice == 'b':
             break
         else:
-            print(f"{Colors.RED}✗ Invalid choice. Please try again.{Colors.END}")
+            print(f"{_FAIL}Invalid choice. Please try again.{_END}")
+
+
+class _ViewportControl(FormattedTextControl):
+    """Formatted text control that records the height it is rendered at."""
+    
+    def __init__(self, *args, **kwargs):
+        """Initialize the control with no height known yet."""
+        super().__init__(*args, **kwargs)
+        self.height: Optional[int] = None
+    
+    def preferred_height(self, width, max_available_height, wrap_lines, get_line_prefix):
+        """
+        Leave the height to the layout.
+        
+        The base class would format the text here, before the real height
+        is known, and that text is reused for the rest of the render.
+        """
+        return None
+    
+    def create_content(self, width, height):
+        """Record the height the control is given, then create its content."""
+        if height is not None:
+            self.height = height
+        return super().create_content(width, height)
 
 
 class NoteCLI:
@@ -563,112 +809,341 @@ class NoteCLI:
     def __init__(self):
         """Initialize the Note CLI application."""
         self.config = load_config()
-        self.all_notes = find_notes(self.config["folders"])
-        self.state: AppState = {
-            "selected_index": 0,
-            "filtered_notes": [],
-            "note_to_open": None,
-            "manage_folders": False,
-            "create_file_in": None,
-            "create_folder_in": None,
-            "delete_file": None,
-            "show_help": False,
-            "expanded_folders": set(),
-            "tree_items": []
-        }
+        self.all_notes: List[Path] = []
+        self._resolved_roots: List[Path] = []
+        self._note_index: Dict[Path, Tuple[Path, str]] = {}
+        self._folder_to_notes: Dict[str, List[Path]] = {}
+        self._all_dirs: Set[str] = set()
+        # Scan results per resolved folder, reused while its directories are unmodified
+        self._notes_cache: Dict[str, Tuple[Dict[str, int], List[Path], Set[str]]] = {}
+        self._note_name_lc: Dict[Path, str] = {}
+        # Notes containing each three-character substring of their lowercased name
+        self._note_trigrams: Dict[str, Set[Path]] = {}
+        self._sorted_folders: List[str] = []
+        self._folder_lc: Dict[str, str] = {}
+        self._folder_parts: Dict[str, Tuple[str, ...]] = {}
+        self._folder_display: Dict[str, str] = {}
+        # Folders are numbered by their position in the sorted folder list
+        self._folder_id: Dict[str, int] = {}
+        self._id_folder: List[str] = []
+        self._top_folder_ids: List[int] = []
+        self._children_ids: Dict[int, List[int]] = {}
+        # Set whenever the notes on disk were rescanned and the folder index is stale
+        self._tree_dirty = True
+        self._refresh_notes()
+        self.state = AppState()
+        # Notes control of the current layout and the row list reused by each render
+        self._notes_control: Optional[_ViewportControl] = None
+        self._row_buffer: List[Tuple[str, str]] = []
+        # Bumped whenever the tree items or expanded folders change, so the
+        # rendered rows can be reused until then
+        self._tree_version = 0
+        self._notes_text_cache: Tuple[Optional[Tuple[int, int, int]], List[Tuple[str, str]]] = (None, [])
+        # Latest search text and the timer that will apply it
+        self._pending_query = ""
+        self._filter_handle: Optional[asyncio.TimerHandle] = None
+        # Result of the last post-TUI action, shown under the tree until it expires
+        self._status_message: Optional[Tuple[str, str]] = None
+        self._status_handle: Optional[asyncio.TimerHandle] = None
+        # State fields checked after the TUI exits, and the handler run for the first one set
+        self._post_actions: List[Tuple[str, Callable[[Any], None]]] = [
+            ("note_to_open", self._on_open_note),
+            ("create_file_in", self._on_create_file),
+            ("create_folder_in", self._on_create_folder),
+            ("delete_file", self._on_delete_file),
+            ("show_help", self._on_show_help),
+            ("manage_folders", self._on_manage_folders),
+        ]
         self.kb = KeyBindings()
         self._setup_key_bindings()
         self._initialize_state()
+        # The TUI is built once and run again after every post-TUI action
+        self._search_buffer = Buffer(on_text_changed=self._update_filtered_notes)
+        self._app = Application(
+            layout=self._create_layout(),
+            key_bindings=self.kb,
+            full_screen=True,
+            style=self._create_style()
+        )
     
-    def _get_folders(self) -> List[str]:
+    def _refresh_notes(self, changed_path: Optional[Path] = None) -> None:
         """
-        Get all folders that contain notes or are empty.
+        Rescan the configured folders and rebuild the note index.
         
-        Returns:
-            List of folder paths as strings
+        Args:
+            changed_path: File or folder just created or deleted here. When
+                given, only the configured folder containing it is rescanned
+                and the others are reused from the scan cache without
+                checking for changes, so edits made outside the app in those
+                folders show up after the next full refresh (which runs when
+                the folder menu is closed).
         """
-        folders = set()
+        # Notes or folders may have been created, deleted or replaced
+        _resolve.cache_clear()
+        if changed_path is not None:
+            self._invalidate_root(changed_path)
+        self.all_notes, self._all_dirs = scan_folders(
+            self.config["folders"], self._notes_cache, verify=changed_path is None
+        )
+        self._index_notes()
+        self._tree_dirty = True
+    
+    def _invalidate_root(self, path: Path) -> None:
+        """
+        Drop the cached scan of the configured folder containing a path.
+        
+        Args:
+            path: File or folder that was just created or deleted
+        """
+        for root in self._resolved_roots:
+            try:
+                path.relative_to(root)
+            except ValueError:
+                continue
+            self._notes_cache.pop(str(root), None)
+            return
+    
+    def _index_notes(self) -> None:
+        """
+        Map every note to its configured root and relative parent folder.
+        
+        Resolving the roots and computing relative paths once here keeps
+        tree rebuilds (which happen on every keypress) free of path syscalls.
+        Notes per folder keep the name order of all_notes.
+        """
+        self._resolved_roots = [_resolve(folder) for folder in self.config["folders"]]
+        self._note_index = {}
+        self._folder_to_notes = {}
+        self._note_name_lc = {note: note.name.lower() for note in self.all_notes}
         
-        # Add folders that contain notes
         for note in self.all_notes:
-            for folder in self.config["folders"]:
-                folder_path = Path(folder).expanduser().resolve()
+            for root in self._resolved_roots:
                 try:
-                    relative_path = note.parent.relative_to(folder_path)
-                    if relative_path:
-                        folders.add(str(relative_path))
-                        # Add all parent folders
-                        path_parts = str(relative_path).split('/')
-                        for i in range(1, len(path_parts)):
-                            parent_folder = '/'.join(path_parts[:i])
-                            folders.add(parent_folder)
-                    break
+                    relative_folder = sys.intern(note.parent.relative_to(root).as_posix())
                 except ValueError:
                     continue
+                self._note_index[note] = (root, relative_folder)
+                self._folder_to_notes.setdefault(relative_folder, []).append(note)
+                break
+        
+        self._note_trigrams = {}
+        for note in self._note_index:
+            name_lc = self._note_name_lc[note]
+            for trigram in {name_lc[i:i + 3] for i in range(len(name_lc) - 2)}:
+                self._note_trigrams.setdefault(trigram, set()).add(note)
+    
+    def _get_folders(self) -> Set[str]:
+        """
+        Get all folders that contain notes or are empty.
+        
+        Returns:
+            Set of folder paths as strings, left unsorted for _index_folders
+        """
+        folders = set()
+        
+        # Add folders that contain notes
+        for _, relative_folder in self._note_index.values():
+            folders.add(relative_folder)
+            # Add all parent folders
+            path_parts = relative_folder.split('/')
+            for i in range(1, len(path_parts)):
+                folders.add(sys.intern('/'.join(path_parts[:i])))
+        
+        # Every scanned subfolder is shown, including empty ones
+        folders.update(self._all_dirs)
+        
+        return folders
+    
+    def _index_folders(self, folders: Set[str]) -> None:
+        """
+        Cache the sorted folder list, path components, display and lowercased
+        names, the top-level folders and the direct children of each folder.
         
-        # Add empty folders
-        for folder in self.config["folders"]:
-            folder_path = Path(folder).expanduser().resolve()
-            if folder_path.is_dir():
-                for root, dirs, files in os.walk(folder_path):
-                    root_path = Path(root)
-                    try:
-                        relative_root = root_path.relative_to(folder_path)
-                        if str(relative_root) != ".":
-                            has_notes = any(Path(f).suffix.lower() in NOTE_EXTENSIONS for f in files)
-                            if not has_notes:
-                                folders.add(str(relative_root))
-                                # Add parent folders
-                                path_parts = str(relative_root).split('/')
-                                for i in range(1, len(path_parts)):
-                                    parent_folder = '/'.join(path_parts[:i])
-                                    folders.add(parent_folder)
-                    except ValueError:
-                        continue
-        
-        return sorted(list(folders), key=lambda x: x)
-    
-    def _build_tree_items(self, folders: List[str], query: str = "") -> List[TreeItem]:
-        """
-        Build a tree structure of folders and their contents.
+        Paths are split into components once here so tree building and
+        rendering never split or join folder paths.
+        
+        Args:
+            folders: Set of folder paths
+        """
+        self._folder_parts = {folder: tuple(folder.split('/')) for folder in folders}
+        # Sort by path components so every folder is directly followed by its subtree
+        self._sorted_folders = sorted(folders, key=self._folder_parts.__getitem__)
+        self._folder_lc = {folder: folder.lower() for folder in folders}
+        # Show only the folder name (last part of the path)
+        self._folder_display = {folder: parts[-1] for folder, parts in self._folder_parts.items()}
+        
+        # Number the folders, carrying the expanded state over to the new ids
+        expanded = {self._id_folder[folder_id] for folder_id in self.state.expanded_folder_ids}
+        self._id_folder = self._sorted_folders
+        self._folder_id = {folder: folder_id for folder_id, folder in enumerate(self._id_folder)}
+        self.state.expanded_folder_ids = {self._folder_id[folder] for folder in expanded if folder in self._folder_id}
+        
+        self._top_folder_ids = []
+        self._children_ids = {}
+        for folder_id, folder in enumerate(self._id_folder):
+            folder_parts = self._folder_parts[folder]
+            if len(folder_parts) > 1:
+                parent_id = self._folder_id['/'.join(folder_parts[:-1])]
+                self._children_ids.setdefault(parent_id, []).append(folder_id)
+            else:
+                self._top_folder_ids.append(folder_id)
+    
+    def _build_tree_items(self, query: str = "") -> List[TreeItem]:
+        """
+        Build a tree structure of the indexed folders and their contents.
         
         Args:
-            folders: List of folder paths
             query: Search query to filter results
             
         Returns:
-            List of tree items (type, item, indent_level)
+            List of tree items (type, item, indent_level, row_text)
         """
         tree_items = []
-        sorted_folders = sorted(folders, key=lambda x: x)
+        query = query.lower()
         
-        for folder in sorted_folders:
-            # Filter by search query
-            if query and query not in folder.lower():
+        if not query:
+            # Walk down from the top-level folders, only visiting expanded subtrees
+            for folder_id in self._top_folder_ids:
+                tree_items.append(self._folder_item(folder_id, 0))
+                if folder_id in self.state.expanded_folder_ids:
+                    tree_items.extend(self._expand_subtree(folder_id))
+            return tree_items
+        
+        # Longer queries can only match notes sharing all of their trigrams
+        candidate_folders = None
+        if len(query) >= 3:
+            candidate_folders = {self._note_index[note][1] for note in self._trigram_candidates(query)}
+        
+        # Searching shows every matching folder along with its matching notes
+        for folder in self._sorted_folders:
+            if query not in self._folder_lc[folder]:
                 continue
+            indent_level = (len(self._folder_parts[folder]) - 1) * 2
+            tree_items.append(self._folder_item(self._folder_id[folder], indent_level))
+            if candidate_folders is not None and folder not in candidate_folders:
+                continue
+            for note in self._get_notes_in_folder(folder):
+                if query in self._note_name_lc[note]:
+                    tree_items.append(self._note_item(note, indent_level + 2))
+        
+        return tree_items
+    
+    def _folder_item(self, folder_id: int, indent_level: int) -> TreeItem:
+        """
+        Create the tree item for a folder, with its row text ready to render.
+        
+        Args:
+            folder_id: Id of the folder
+            indent_level: Indentation of the folder row
             
-            # Check visibility based on parent expansion
-            should_show = True
-            if not query:
-                folder_parts = folder.split('/')
-                for i in range(1, len(folder_parts)):
-                    parent_folder = '/'.join(folder_parts[:i])
-                    if parent_folder in folders and parent_folder not in self.state["expanded_folders"]:
-                        should_show = False
-                        break
+        Returns:
+            Tree item whose row shows the folder's current expanded state
+        """
+        folder = self._id_folder[folder_id]
+        expand_indicator = "▼" if folder_id in self.state.expanded_folder_ids else "▶"
+        return ("folder", folder, indent_level,
+                f"{'  ' * indent_level}{expand_indicator} 📁 {self._folder_display[folder]}\n")
+    
+    def _note_item(self, note: Path, indent_level: int) -> TreeItem:
+        """
+        Create the tree item for a note, with its row text ready to render.
+        
+        Args:
+            note: Note file
+            indent_level: Indentation of the note row
             
-            if should_show:
-                indent_level = folder.count('/') * 2
-                tree_items.append(("folder", folder, indent_level))
-                
-                # Show folder contents if expanded or searching
-                if folder in self.state["expanded_folders"] or query:
-                    folder_notes = self._get_notes_in_folder(folder)
-                    for note in sorted(folder_notes, key=lambda x: x.name):
-                        if not query or query in note.name.lower():
-                            tree_items.append(("note", note, indent_level + 2))
+        Returns:
+            Tree item for the note
+        """
+        return ("note", note, indent_level, f"{'  ' * indent_level}  📄 {note.name}\n")
+    
+    def _trigram_candidates(self, query: str) -> Set[Path]:
+        """
+        Find the notes whose names contain every trigram of a query.
         
-        return tree_items
+        Args:
+            query: Lowercased search query of at least three characters
+            
+        Returns:
+            Set of notes that may contain the query, a superset of the matches
+        """
+        trigram_sets = []
+        for trigram in {query[i:i + 3] for i in range(len(query) - 2)}:
+            notes = self._note_trigrams.get(trigram)
+            if not notes:
+                return set()
+            trigram_sets.append(notes)
+        # Intersect starting from the rarest trigram
+        trigram_sets.sort(key=len)
+        return trigram_sets[0].intersection(*trigram_sets[1:])
+    
+    def _is_expanded(self, folder: str) -> bool:
+        """
+        Check whether a folder is expanded.
+        
+        Args:
+            folder: Folder path to check
+            
+        Returns:
+            True if the folder is expanded, False otherwise
+        """
+        return self._folder_id[folder] in self.state.expanded_folder_ids
+    
+    def _expand_subtree(self, folder_id: int) -> List[TreeItem]:
+        """
+        Build the tree items shown beneath a folder when it is expanded.
+        
+        Args:
+            folder_id: Id of the folder being expanded
+            
+        Returns:
+            List of tree items for the folder's notes and subfolders,
+            recursing into subfolders that are themselves expanded
+        """
+        folder = self._id_folder[folder_id]
+        indent_level = (len(self._folder_parts[folder]) - 1) * 2
+        subtree = [self._note_item(note, indent_level + 2) for note in self._get_notes_in_folder(folder)]
+        for child_id in self._children_ids.get(folder_id, []):
+            subtree.append(self._folder_item(child_id, indent_level + 2))
+            if child_id in self.state.expanded_folder_ids:
+                subtree.extend(self._expand_subtree(child_id))
+        return subtree
+    
+    def _expand_folder_at(self, index: int) -> None:
+        """
+        Expand the folder at the given tree position, splicing in its subtree.
+        
+        Args:
+            index: Position of the folder in the tree items
+        """
+        tree_items = self.state.tree_items
+        item_type, folder, indent, row_text = tree_items[index]
+        folder_id = self._folder_id[folder]
+        self.state.expanded_folder_ids.add(folder_id)
+        tree_items[index] = self._folder_item(folder_id, indent)
+        self._tree_version += 1
+        # Search results already list every match, only the indicator changes
+        if not self.state.query:
+            tree_items[index + 1:index + 1] = self._expand_subtree(folder_id)
+    
+    def _collapse_folder_at(self, index: int) -> None:
+        """
+        Collapse the folder at the given tree position, removing its subtree.
+        
+        Args:
+            index: Position of the folder in the tree items
+        """
+        tree_items = self.state.tree_items
+        item_type, folder, indent, row_text = tree_items[index]
+        folder_id = self._folder_id[folder]
+        self.state.expanded_folder_ids.discard(folder_id)
+        tree_items[index] = self._folder_item(folder_id, indent)
+        self._tree_version += 1
+        if not self.state.query:
+            end = index + 1
+            while end < len(tree_items) and tree_items[end][2] > indent:
+                end += 1
+            del tree_items[index + 1:end]
     
     def _get_notes_in_folder(self, folder: str) -> List[Path]:
         """
@@ -680,43 +1155,35 @@ class NoteCLI:
         Returns:
             List of note files in the folder
         """
-        folder_notes = []
-        for note in self.all_notes:
-            for config_folder in self.config["folders"]:
-                config_path = Path(config_folder).expanduser().resolve()
-                try:
-                    note_relative_path = note.parent.relative_to(config_path)
-                    if str(note_relative_path) == folder:
-                        folder_notes.append(note)
-                        break
-                except ValueError:
-                    continue
-        return folder_notes
+        return self._folder_to_notes.get(folder, [])
     
     def _initialize_state(self) -> None:
         """Initialize the application state."""
-        self.state["filtered_notes"] = self._get_folders()
-        self.state["tree_items"] = self._build_tree_items(self.state["filtered_notes"])
+        # Only recompute the folder index when the notes were rescanned
+        if self._tree_dirty:
+            self._index_folders(self._get_folders())
+            self._tree_dirty = False
+        self.state.tree_items = self._build_tree_items(self.state.query)
+        self._tree_version += 1
     
     def _reset_state(self) -> None:
         """Reset the application state to initial values."""
         # Preserve expanded folders state
-        expanded_folders = self.state.get("expanded_folders", set())
-        
-        self.state = {
-            "selected_index": 0,
-            "filtered_notes": [],
-            "note_to_open": None,
-            "manage_folders": False,
-            "create_file_in": None,
-            "create_folder_in": None,
-            "delete_file": None,
-            "show_help": False,
-            "expanded_folders": expanded_folders,
-            "tree_items": []
-        }
+        self.state = AppState(self.state.expanded_folder_ids)
+        # Keep the search, including text typed just before leaving the TUI
+        # whose debounced filter never ran
+        if self._filter_handle is not None:
+            self._filter_handle.cancel()
+            self._filter_handle = None
+        self._pending_query = self._search_buffer.text
+        self.state.query = self._pending_query.lower()
         self._initialize_state()
     
+    def _clear_search(self) -> None:
+        """Empty the search bar so the next round-trip shows the full tree."""
+        self._pending_query = ""
+        self._search_buffer.reset()
+    
     def _setup_key_bindings(self) -> None:
         """Set up all key bindings for the application."""
         
@@ -733,152 +1200,249 @@ class NoteCLI:
         @self.kb.add("down")
         def move_down(event):
             """Move selection down."""
-            if self.state["tree_items"]:
-                self.state["selected_index"] = (self.state["selected_index"] + 1) % len(self.state["tree_items"])
+            self._flush_pending_filter()
+            if self.state.tree_items:
+                self.state.selected_index = (self.state.selected_index + 1) % len(self.state.tree_items)
 
         @self.kb.add("up")
         def move_up(event):
             """Move selection up."""
-            if self.state["tree_items"]:
-                self.state["selected_index"] = (self.state["selected_index"] - 1 + len(self.state["tree_items"])) % len(self.state["tree_items"])
+            self._flush_pending_filter()
+            if self.state.tree_items:
+                self.state.selected_index = (self.state.selected_index - 1 + len(self.state.tree_items)) % len(self.state.tree_items)
 
         @self.kb.add("right")
         def expand_folder(event):
             """Expand the selected folder."""
-            if self.state["tree_items"]:
-                item_type, item, indent = self.state["tree_items"][self.state["selected_index"]]
-                if item_type == "folder" and item not in self.state["expanded_folders"]:
-                    self.state["expanded_folders"].add(item)
-                    self.state["tree_items"] = self._build_tree_items(self.state["filtered_notes"])
+            self._flush_pending_filter()
+            if self.state.tree_items:
+                item_type, item = self.state.tree_items[self.state.selected_index][:2]
+                if item_type == "folder" and not self._is_expanded(item):
+                    self._expand_folder_at(self.state.selected_index)
 
         @self.kb.add("left")
         def collapse_folder(event):
             """Collapse the selected folder."""
-            if self.state["tree_items"]:
-                item_type, item, indent = self.state["tree_items"][self.state["selected_index"]]
-                if item_type == "folder" and item in self.state["expanded_folders"]:
-                    self.state["expanded_folders"].remove(item)
-                    self.state["tree_items"] = self._build_tree_items(self.state["filtered_notes"])
+            self._flush_pending_filter()
+            if self.state.tree_items:
+                item_type, item = self.state.tree_items[self.state.selected_index][:2]
+                if item_type == "folder" and self._is_expanded(item):
+                    self._collapse_folder_at(self.state.selected_index)
 
         @self.kb.add("enter", eager=True)
         def toggle_or_open(event):
             """Toggle folder expansion or open note."""
-            if self.state["tree_items"]:
-                item_type, item, indent = self.state["tree_items"][self.state["selected_index"]]
+            self._flush_pending_filter()
+            if self.state.tree_items:
+                item_type, item = self.state.tree_items[self.state.selected_index][:2]
                 if item_type == "note":
-                    self.state["note_to_open"] = item
+                    self.state.note_to_open = item
                     event.app.exit()
                 elif item_type == "folder":
-                    if item in self.state["expanded_folders"]:
-                        self.state["expanded_folders"].remove(item)
+                    if self._is_expanded(item):
+                        self._collapse_folder_at(self.state.selected_index)
                     else:
-                        self.state["expanded_folders"].add(item)
-                    self.state["tree_items"] = self._build_tree_items(self.state["filtered_notes"])
+                        self._expand_folder_at(self.state.selected_index)
 
         # File operations
         @self.kb.add("c-o")
         def open_note(event):
             """Open the selected note."""
-            if self.state["tree_items"]:
-                item_type, item, indent = self.state["tree_items"][self.state["selected_index"]]
+            self._flush_pending_filter()
+            if self.state.tree_items:
+                item_type, item = self.state.tree_items[self.state.selected_index][:2]
                 if item_type == "note":
-                    self.state["note_to_open"] = item
+                    self.state.note_to_open = item
                     event.app.exit()
 
         @self.kb.add("c-n")
         def create_note(event):
             """Create a new note in the selected folder."""
-            if self.state["tree_items"]:
-                item_type, item, indent = self.state["tree_items"][self.state["selected_index"]]
+            self._flush_pending_filter()
+            if self.state.tree_items:
+                item_type, item = self.state.tree_items[self.state.selected_index][:2]
                 if item_type == "folder":
-                    self.state["create_file_in"] = item
+                    self.state.create_file_in = item
                     event.app.exit()
 
         @self.kb.add("c-f")
         def create_folder(event):
             """Create a new folder within the selected folder."""
-            if self.state["tree_items"]:
-                item_type, item, indent = self.state["tree_items"][self.state["selected_index"]]
+            self._flush_pending_filter()
+            if self.state.tree_items:
+                item_type, item = self.state.tree_items[self.state.selected_index][:2]
                 if item_type == "folder":
-                    self.state["create_folder_in"] = item
+                    self.state.create_folder_in = item
                     event.app.exit()
 
         @self.kb.add("c-d")
         def delete_file(event):
             """Delete the selected file."""
-            if self.state["tree_items"]:
-                item_type, item, indent = self.state["tree_items"][self.state["selected_index"]]
+            self._flush_pending_filter()
+            if self.state.tree_items:
+                item_type, item = self.state.tree_items[self.state.selected_index][:2]
                 if item_type == "note":
-                    self.state["delete_file"] = item
+                    self.state.delete_file = item
                     event.app.exit()
 
         # Management and help
         @self.kb.add("c-s")
         def manage_folders(event):
             """Open folder management menu."""
-            self.state["manage_folders"] = True
+            self.state.manage_folders = True
             event.app.exit()
 
         @self.kb.add("c-i")
         def show_help(event):
             """Show help information."""
-            self.state["show_help"] = True
+            self.state.show_help = True
             event.app.exit()
 
 
     
     def _update_filtered_notes(self, buff: Buffer) -> None:
         """
-        Update filtered notes when search text changes.
+        Schedule a tree update when search text changes.
+        
+        The rebuild is delayed by SEARCH_DEBOUNCE_SECONDS and rescheduled on
+        every keystroke, so typing a word triggers a single rebuild.
         
         Args:
             buff: Search buffer containing the query
         """
-        query = buff.text.lower()
-        self.state["filtered_notes"] = self._get_folders()
-        self.state["tree_items"] = self._build_tree_items(self.state["filtered_notes"], query)
-        self.state["selected_index"] = 0
+        self._pending_query = buff.text
+        if self._filter_handle is not None:
+            self._filter_handle.cancel()
+            self._filter_handle = None
+        
+        loop = get_app().loop
+        if loop is None:
+            self._do_filter()
+        else:
+            self._filter_handle = loop.call_later(SEARCH_DEBOUNCE_SECONDS, self._do_filter)
+    
+    def _flush_pending_filter(self) -> None:
+        """Apply a debounced search right away so keys act on the current rows."""
+        if self._filter_handle is not None:
+            self._filter_handle.cancel()
+            self._do_filter()
+    
+    def _do_filter(self) -> None:
+        """Rebuild the tree for the latest search text and redraw."""
+        self._filter_handle = None
+        # The folder list cannot change while the TUI is running, so only
+        # the cached tree needs filtering here
+        query = self._pending_query.lower()
+        if query == self.state.query:
+            return
+        self.state.query = query
+        self.state.tree_items = self._build_tree_items(query)
+        self._tree_version += 1
+        self.state.selected_index = 0
+        get_app().invalidate()
+    
+    def _get_viewport_height(self) -> int:
+        """
+        Get the number of tree rows that fit in the notes window.
+        
+        Returns:
+            Height the notes window is being rendered at, or the terminal
+            height if it has not been rendered yet
+        """
+        if self._notes_control is not None and self._notes_control.height is not None:
+            return max(1, self._notes_control.height)
+        return max(1, get_app().output.get_size().rows)
     
     def _get_notes_text(self) -> List[Tuple[str, str]]:
         """
-        Create formatted text for the notes list display.
+        Create formatted text for the rows of the notes list in view.
+        
+        Only the rows between scroll_top and the bottom of the notes window
+        are formatted, so rendering cost does not grow with the tree size.
         
         Returns:
             List of (style, text) tuples for display
         """
-        result = []
-        for i, (item_type, item, indent) in enumerate(self.state["tree_items"]):
-            is_selected = i == self.state["selected_index"]
-            indent_str = "  " * indent
-            
-            if item_type == "folder":
-                style = "class:selected-folder" if is_selected else "class:folder"
-                expand_indicator = "▼" if item in self.state["expanded_folders"] else "▶"
-                # Show only the folder name (last part of the path)
-                folder_name = item.split('/')[-1] if '/' in item else item
-                result.append((style, f"{indent_str}{expand_indicator} 📁 {folder_name}"))
-                result.append(("", "\n"))
-            else:  # note
-                style = "class:selected" if is_selected else ""
-                result.append((style, f"{indent_str}  📄 {item.name}"))
-                result.append(("", "\n"))
-        
-        if not self.state["tree_items"]:
-            result.append(("", "No folders or notes found."))
+        tree_items = self.state.tree_items
+        if not tree_items:
+            return [("", "No folders or notes found.")]
+        
+        height = self._get_viewport_height()
+        selected_index = self.state.selected_index
+        cache_key = (self._tree_version, selected_index, height)
+        if self._notes_text_cache[0] == cache_key:
+            return self._notes_text_cache[1]
+        
+        # Scroll just enough to keep the selection in view
+        top = self.state.scroll_top
+        if selected_index < top:
+            top = selected_index
+        elif selected_index >= top + height:
+            top = selected_index - height + 1
+        top = max(0, min(top, len(tree_items) - height))
+        self.state.scroll_top = top
+        
+        # Consecutive rows sharing a style are merged into a single fragment
+        result = self._row_buffer
+        result.clear()
+        run_style = ""
+        run_rows: List[str] = []
+        for i in range(top, min(top + height, len(tree_items))):
+            # Row text is prepared when the tree item is created
+            item_type, item, indent, row = tree_items[i]
+            style = _ROW_STYLES[item_type == "folder"][i == selected_index]
+            if style != run_style and run_rows:
+                result.append((run_style, "".join(run_rows)))
+                run_rows.clear()
+            run_style = style
+            run_rows.append(row)
+        
+        if run_rows:
+            result.append((run_style, "".join(run_rows)))
+        
+        self._notes_text_cache = (cache_key, result)
         return result
     
+    def _get_status_text(self) -> List[Tuple[str, str]]:
+        """
+        Create formatted text for the status line.
+        
+        Returns:
+            List of (style, text) tuples for display
+        """
+        if self._status_message is None:
+            return []
+        return [self._status_message]
+    
+    def _schedule_status_clear(self) -> None:
+        """Hide the status message STATUS_MESSAGE_SECONDS after the TUI starts."""
+        if self._status_message is not None:
+            self._status_handle = get_app().loop.call_later(STATUS_MESSAGE_SECONDS, self._clear_status)
+    
+    def _clear_status(self) -> None:
+        """Hide the status message and redraw."""
+        self._status_handle = None
+        self._status_message = None
+        get_app().invalidate()
+    
     def _create_layout(self) -> Layout:
         """Create the application layout."""
-        # Search buffer and window
-        search_buffer = Buffer(on_text_changed=self._update_filtered_notes)
+        # Search window
         search_window = Window(
-            content=BufferControl(buffer=search_buffer),
+            content=BufferControl(buffer=self._search_buffer),
             height=1,
             style="class:search-bar"
         )
         
         # Notes display window
-        notes_window = Window(content=FormattedTextControl(self._get_notes_text))
+        self._notes_control = _ViewportControl(self._get_notes_text)
+        notes_window = Window(content=self._notes_control)
+        
+        # Status line, shown only while there is a message
+        status_window = ConditionalContainer(
+            Window(FormattedTextControl(self._get_status_text), height=1),
+            filter=Condition(lambda: self._status_message is not None)
+        )
         
         # Layout sections
         top_section = HSplit([
@@ -888,7 +1452,8 @@ class NoteCLI:
         ], height=Dimension(weight=7))
         
         bottom_section = HSplit([
-            notes_window
+            notes_window,
+            status_window
         ], height=Dimension(weight=93))
         
         root_container = HSplit([top_section, bottom_section])
@@ -901,72 +1466,102 @@ class NoteCLI:
             'selected': 'bg:#0055aa #ffffff bold',
             'folder': 'fg:#00aa00 bold',
             'selected-folder': 'bg:#0055aa #ffffff bold',
+            'status': 'fg:#00aa00 bold',
         })
     
+    def _on_open_note(self, note: Path) -> None:
+        """
+        Open the selected note in the editor.
+        
+        Args:
+            note: Note to open
+        """
+        open_note(note)
+    
+    def _on_create_file(self, folder: str) -> None:
+        """
+        Create a note in the selected folder and open it.
+        
+        Args:
+            folder: Folder to create the note in
+        """
+        clear_screen()
+        new_file = create_new_note(folder, self.config)
+        if new_file:
+            print(f"{Colors.CYAN}Opening file in editor...{Colors.END}")
+            # Update the all_notes list to include the new file
+            self._refresh_notes(new_file)
+            open_note(new_file)
+            self._status_message = ("class:status", f"✓ Created note {new_file.name}")
+        else:
+            print(f"{Colors.RED}{Colors.BOLD}✗ Failed to create file.{Colors.END}")
+            wait_for_key()
+    
+    def _on_create_folder(self, parent_folder: str) -> None:
+        """
+        Create a subfolder in the selected folder.
+        
+        Args:
+            parent_folder: Folder to create the subfolder in
+        """
+        clear_screen()
+        new_folder = create_new_folder(parent_folder, self.config)
+        if new_folder:
+            # Rescan so the new folder shows up in the tree
+            self._refresh_notes(new_folder)
+            self._status_message = ("class:status", f"✓ Created folder {new_folder.name}")
+        else:
+            print(f"{Colors.RED}{Colors.BOLD}✗ Failed to create folder.{Colors.END}")
+            wait_for_key()
+    
+    def _on_delete_file(self, note: Path) -> None:
+        """
+        Delete the selected note after confirmation.
+        
+        Args:
+            note: Note to delete
+        """
+        clear_screen()
+        file_deleted = delete_file(note, self.config)
+        if file_deleted:
+            # Update the all_notes list to remove the deleted file
+            self._refresh_notes(note)
+            # The search that led to the deleted note is no longer useful
+            self._clear_search()
+            self._status_message = ("class:status", f"✓ Deleted {note.name}")
+        else:
+            # Leave the reason on screen until the user is done reading it
+            wait_for_key()
+    
+    def _on_show_help(self, _: bool) -> None:
+        """Show the help screen."""
+        clear_screen()
+        show_info()
+    
+    def _on_manage_folders(self, _: bool) -> None:
+        """Show the folder management menu and rescan afterwards."""
+        clear_screen()
+        manage_folders_menu(self.config)
+        # Search folders may have changed, so rescan and reindex
+        self._refresh_notes()
+        self._status_message = ("class:status", "✓ Configuration updated.")
+    
     def run(self) -> None:
         """Run the main application loop."""
         while True:
-            layout = self._create_layout()
-            style = self._create_style()
-            
-            app = Application(
-                layout=layout,
-                key_bindings=self.kb,
-                full_screen=True,
-                style=style
-            )
-            
-            app.run()
+            self._app.run(pre_run=self._schedule_status_clear)
+            if self._status_handle is not None:
+                self._status_handle.cancel()
+                self._status_handle = None
+            self._status_message = None
             
             # Handle post-TUI actions
-            if self.state["note_to_open"]:
-                open_note(self.state["note_to_open"])
-                self._reset_state()
-            elif self.state["create_file_in"]:
-                clear_screen()
-                new_file = create_new_note(self.state["create_file_in"], self.config)
-                if new_file:
-                    print(f"{Colors.GREEN}{Colors.BOLD}✓ File created successfully!{Colors.END}")
-                    print(f"{Colors.CYAN}Opening file in editor...{Colors.END}")
-                    # Update the all_notes list to include the new file
-                    self.all_notes = find_notes(self.config["folders"])
-                    time.sleep(1)   
-                    open_note(new_file)
-                else:
-                    print(f"{Colors.RED}{Colors.BOLD}✗ Failed to create file.{Colors.END}")
-                    time.sleep(1)
-                    input("Press Enter to return..")
-                self._reset_state()
-            elif self.state["create_folder_in"]:
-                clear_screen()
-                new_folder = create_new_folder(self.state["create_folder_in"], self.config)
-                if new_folder:
-                    print(f"{Colors.GREEN}{Colors.BOLD}✓ Folder created successfully!{Colors.END}")
-                else:
-                    print(f"{Colors.RED}{Colors.BOLD}✗ Failed to create folder.{Colors.END}")
-                    time.sleep(1)
-                    input("Press Enter to return..")
-                self._reset_state()
-            elif self.state["delete_file"]:
-                clear_screen()
-                file_deleted = delete_file(self.state["delete_file"], self.config)
-                if file_deleted:
-                    # Update the all_notes list to remove the deleted file
-                    self.all_notes = find_notes(self.config["folders"])
-                time.sleep(1)
-                input("Press Enter to return..")
-                self._reset_state()
-            elif self.state["show_help"]:
-                clear_screen()
-                show_info()
-                self._reset_state()
-            elif self.state["manage_folders"]:
-                clear_screen()
-                manage_folders_menu(self.config)
-                print(f"{Colors.GREEN}{Colors.BOLD}✓ Configuration updated.{Colors.END}")
-                time.sleep(1)
-                input("Press Enter to return..")
-                self._reset_state()
+            for field, handler in self._post_actions:
+                value = getattr(self.state, field)
+                if value:
+                    handler(value)
+                    self._reset_state()
+                    break
             else:
                 # No action to perform, exit the loop
                 break